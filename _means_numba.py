@@ -0,0 +1,37 @@
+"""
+Optional numba-compiled kernel for the historical mean reduction.
+
+Importing this module raises ImportError when numba is not installed;
+etl_exchange_rates.py then falls back to its numpy implementation.
+"""
+
+from typing import Tuple
+from numba import njit
+import numpy as np
+
+
+@njit(cache=True)
+def col_stats(rates: np.ndarray) -> Tuple[float, int]:
+    """
+    Sum and count the positive rates of a column in a single pass.
+    
+    fastmath is deliberately not enabled: it lets the compiler assume there are
+    no NaNs, and NaN is how missing rates are represented here.
+    
+    Args:
+        rates: 1-D float array of exchange rates, NaN for missing values
+    
+    Returns:
+        Tuple of (sum of positive rates, number of positive rates)
+    """
+    total: float = 0.0
+    count: int = 0
+    
+    for i in range(rates.shape[0]):
+        value = rates[i]
+        # NaN compares False, so missing rates are skipped as well
+        if value > 0:
+            total += value
+            count += 1
+    
+    return total, count
@@ -10,13 +10,111 @@ within the ZIP archives. This script processes that CSV data directly.
 
 """
 
+import csv
+import math
 from pathlib import Path
-from typing import Dict, List, Any
+from string import Template
+from typing import Callable, Dict, List, Tuple, Any
+import numpy as np
 import pandas as pd
 import sys
 
+# Optional: numba-compiled kernel for the historical mean reduction
+_numba_col_stats: Callable[[np.ndarray], Tuple[float, int]] | None
+try:
+    from _means_numba import col_stats as _numba_col_stats
+except ImportError:
+    _numba_col_stats = None
+
 
 TARGET_CURRENCIES: List[str] = ['USD', 'SEK', 'GBP', 'JPY']
+NA_VALUES: List[str] = ['', 'N/A']
+HISTORICAL_CHUNK_SIZE: int = 50_000
+
+# Directory holding this script and its input/output files, resolved once at import
+_HERE: Path = Path(__file__).resolve().parent
+
+# Static page around the rate table; CSS braces need no escaping in a string.Template
+_HTML_TEMPLATE: Template = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Exchange Rates Report</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            max-width: 800px;
+            margin: 50px auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        h1 {
+            color: #333;
+            text-align: center;
+            margin-bottom: 30px;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            background-color: white;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }
+        th {
+            background-color: #4CAF50;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: bold;
+        }
+        td {
+            padding: 10px 12px;
+            border-bottom: 1px solid #ddd;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 20px;
+            color: #666;
+            font-size: 14px;
+        }
+    </style>
+</head>
+<body>
+    <h1>Exchange Rates Report</h1>
+    <table class="dataframe rate-table">
+  <thead>
+    <tr style="text-align: right;">
+      <th>Currency Code</th>
+      <th>Rate</th>
+      <th>Mean Historical Rate</th>
+    </tr>
+  </thead>
+  <tbody>
+${rows}
+  </tbody>
+</table>
+    <div class="footer">
+        <p>Exchange rates relative to EUR | Source: European Central Bank</p>
+    </div>
+</body>
+</html>
+""")
+
+
+def _read_csv_header(csv_file: Path) -> List[str]:
+    """
+    Read the header row of a CSV file without loading any data rows.
+    
+    Args:
+        csv_file: Path to the CSV file
+        
+    Returns:
+        List of column names with surrounding whitespace skipped
+    """
+    return pd.read_csv(csv_file, nrows=0, skipinitialspace=True).columns.tolist()
 
 
 def parse_daily_rates(csv_file: Path) -> Dict[str, float]:
@@ -35,47 +133,63 @@ def parse_daily_rates(csv_file: Path) -> Dict[str, float]:
     """
     print(f"INFO: Reading daily rates from {csv_file.name}...")
     
-    if not csv_file.exists():
-        error_msg: str = f"Daily rates file not found: {csv_file}"
-        print(f"ERROR: {error_msg}")
-        raise FileNotFoundError(error_msg)
-    
     try:
-        df: pd.DataFrame = pd.read_csv(csv_file, skipinitialspace=True)
+        # The daily file holds a single row, so the stdlib csv module is enough
+        f: Any
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            reader: csv.DictReader = csv.DictReader(f, skipinitialspace=True)
+            
+            if reader.fieldnames is None:
+                raise ValueError(f"CSV file is empty or malformed: {csv_file}")
+            
+            row: Dict[str, str | None] | None = next(reader, None)
         
-        if len(df) == 0:
+        if row is None:
             raise ValueError("CSV file is empty - no data rows found")
         
         daily_rates: Dict[str, float] = {}
         missing_currencies: List[str] = []
         invalid_currencies: List[str] = []
+        warning_lines: List[str] = []
         
         currency: str
         for currency in TARGET_CURRENCIES:
-            if currency not in df.columns:
+            if currency not in row:
                 missing_currencies.append(currency)
                 continue
             
-            rate_value: Any = df[currency].iloc[0]
+            rate_value: str | None = row[currency]
             
-            if pd.isna(rate_value) or rate_value == '' or rate_value == 'N/A':
+            if rate_value is None or rate_value.strip() in NA_VALUES:
                 invalid_currencies.append(currency)
                 continue
             
             try:
                 rate_float: float = float(rate_value)
-                if rate_float <= 0:
-                    print(f"WARNING: {currency} has non-positive rate: {rate_float}")
-                daily_rates[currency] = rate_float
-            except (ValueError, TypeError) as e:
-                print(f"WARNING: Invalid rate value for {currency}: {rate_value}")
+            except ValueError:
+                rate_float = math.nan
+            
+            # float() also accepts 'nan', 'inf' and overflowing values like '1e400'
+            if not math.isfinite(rate_float):
+                warning_lines.append(f"WARNING: Invalid rate value for {currency}: {rate_value}")
                 invalid_currencies.append(currency)
+                continue
+            
+            if rate_float <= 0:
+                warning_lines.append(f"WARNING: {currency} has non-positive rate: {rate_float}")
+                continue
+            
+            daily_rates[currency] = rate_float
         
+        # Collect warnings and emit them in a single write
         if missing_currencies:
-            print(f"WARNING: Missing columns in CSV: {', '.join(missing_currencies)}")
+            warning_lines.append(f"WARNING: Missing columns in CSV: {', '.join(missing_currencies)}")
         
         if invalid_currencies:
-            print(f"WARNING: Invalid/missing values for: {', '.join(invalid_currencies)}")
+            warning_lines.append(f"WARNING: Invalid/missing values for: {', '.join(invalid_currencies)}")
+        
+        if warning_lines:
+            print('\n'.join(warning_lines))
         
         if not daily_rates:
             raise ValueError(
@@ -86,11 +200,7 @@ def parse_daily_rates(csv_file: Path) -> Dict[str, float]:
         print(f"SUCCESS: Extracted {len(daily_rates)} daily rates")
         return daily_rates
         
-    except pd.errors.EmptyDataError:
-        error_msg: str = f"CSV file is empty or malformed: {csv_file}"
-        print(f"ERROR: {error_msg}")
-        raise ValueError(error_msg)
-    except pd.errors.ParserError as e:
+    except csv.Error as e:
         error_msg: str = f"Failed to parse CSV file: {e}"
         print(f"ERROR: {error_msg}")
         raise ValueError(error_msg)
@@ -104,100 +214,164 @@ def parse_daily_rates(csv_file: Path) -> Dict[str, float]:
         raise RuntimeError(error_msg) from e
 
 
-def parse_historical_rates(csv_file: Path) -> pd.DataFrame:
+def _numpy_col_stats(rates: np.ndarray) -> Tuple[float, int]:
     """
-    Parse the historical exchange rates CSV file and extract rates for target currencies.
+    Sum and count the positive rates of a column.
+    
+    Used when numba is not installed; otherwise _means_numba's compiled kernel is used.
+    
+    Args:
+        rates: 1-D float array of exchange rates, NaN for missing values
+        
+    Returns:
+        Tuple of (sum of positive rates, number of positive rates)
+    """
+    # NaN compares False, so missing rates are dropped as well
+    valid: np.ndarray = rates > 0
+    return float(rates[valid].sum()), int(np.count_nonzero(valid))
+
+
+# Prefer the compiled single-pass kernel when numba is available
+_col_stats: Callable[[np.ndarray], Tuple[float, int]] = (
+    _numba_col_stats if _numba_col_stats is not None else _numpy_col_stats
+)
+
+
+def compute_historical_means(csv_file: Path) -> Dict[str, float]:
+    """
+    Stream the historical exchange rates CSV file and calculate the mean rate for each
+    target currency.
+    
+    The file is read in chunks of HISTORICAL_CHUNK_SIZE rows and only running sums and
+    counts are kept, so memory use does not grow with the length of the history.
     
     Args:
         csv_file: Path to the historical rates CSV file
         
     Returns:
-        DataFrame with columns: date, currency, rate
+        Dictionary mapping currency codes to their mean historical rates
         
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
         ValueError: If the CSV is malformed, empty, or missing required currencies
     """
     print(f"INFO: Reading historical rates from {csv_file.name}...")
-    if not csv_file.exists():
-        error_msg: str = f"Historical rates file not found: {csv_file}"
-        print(f"ERROR: {error_msg}")
-        raise FileNotFoundError(error_msg)
     
     try:
-        # Read CSV file with flexible whitespace handling
-        df: pd.DataFrame = pd.read_csv(csv_file, skipinitialspace=True)
-        
-        # Validate CSV is not empty
-        if len(df) == 0:
-            raise ValueError("CSV file is empty - no data rows found")
+        # Read only the header first so that just the target columns get loaded
+        available_columns: List[str] = _read_csv_header(csv_file)
         
         # Check for Date column
-        if 'Date' not in df.columns:
+        if 'Date' not in available_columns:
             raise ValueError("CSV file missing required 'Date' column")
         
-        # Melt the DataFrame to convert from wide to long format
-        # This transforms columns (currencies) into rows
-        historical_data: List[Dict[str, str | float]] = []
-        missing_currencies: List[str] = []
-        currencies_found: Dict[str, int] = {}
+        missing_currencies: List[str] = [
+            curr for curr in TARGET_CURRENCIES if curr not in available_columns
+        ]
+        present_currencies: List[str] = [
+            curr for curr in TARGET_CURRENCIES if curr in available_columns
+        ]
+        
+        if missing_currencies:
+            print('\n'.join(
+                f"WARNING: Currency {currency} not found in historical data"
+                for currency in missing_currencies
+            ))
+        
+        if not present_currencies:
+            raise ValueError(
+                f"No valid historical rates found for any target currencies. "
+                f"Missing: {missing_currencies}"
+            )
         
         currency: str
-        for currency in TARGET_CURRENCIES:
-            if currency not in df.columns:
-                missing_currencies.append(currency)
-                print(f"WARNING: Currency {currency} not found in historical data")
-                continue
-            
-            # Extract all non-null values for this currency
-            valid_count: int = 0
-            idx: Any
-            row: pd.Series[Any]
-            for idx, row in df.iterrows():
-                rate_value: Any = row[currency]
-                
-                # Skip invalid values
-                if pd.isna(rate_value) or rate_value == '' or rate_value == 'N/A':
-                    continue
+        
+        # Running totals per present currency, aligned with present_currencies
+        rate_sums: np.ndarray = np.zeros(len(present_currencies), dtype=np.float64)
+        rate_counts: np.ndarray = np.zeros(len(present_currencies), dtype=np.int64)
+        total_rows: int = 0
+        
+        # The pyarrow engine cannot read in chunks, so this uses the C engine. Dates
+        # are not needed for the means, so the Date column is never loaded
+        reader: Any
+        with pd.read_csv(
+            csv_file,
+            usecols=present_currencies,
+            na_values=NA_VALUES,
+            skipinitialspace=True,
+            engine='c',
+            chunksize=HISTORICAL_CHUNK_SIZE,
+        ) as reader:
+            chunk: pd.DataFrame
+            for chunk in reader:
+                total_rows += len(chunk)
                 
-                # Validate and convert rate
-                try:
-                    rate_float: float = float(rate_value)
-                    date_value: Any = row['Date']
-                    
-                    if rate_float <= 0:
-                        continue  # Skip non-positive rates
-                    
-                    historical_data.append({
-                        'date': str(date_value),
-                        'currency': currency,
-                        'rate': rate_float
-                    })
-                    valid_count += 1
-                except (ValueError, TypeError):
-                    continue  # Skip rows with invalid rate values
-            
-            currencies_found[currency] = valid_count
+                # Reduce each currency column of the wide chunk to the sum and
+                # count of its positive rates. Non-numeric cells are coerced to NaN
+                # here rather than cast at parse time, so one bad cell is skipped
+                # instead of failing the whole file
+                col_idx: int
+                for col_idx, currency in enumerate(present_currencies):
+                    rates: np.ndarray = pd.to_numeric(
+                        chunk[currency], errors='coerce'
+                    ).to_numpy(dtype=np.float64)
+                    col_sum: float
+                    col_count: int
+                    col_sum, col_count = _col_stats(rates)
+                    rate_sums[col_idx] += col_sum
+                    rate_counts[col_idx] += col_count
+        
+        # Validate CSV is not empty
+        if total_rows == 0:
+            raise ValueError("CSV file is empty - no data rows found")
+        
+        # Derive record counts and means from the running totals in a single pass
+        currencies_found: Dict[str, int] = {}
+        mean_rates: Dict[str, float] = {}
+        
+        rate_sum: float
+        count: int
+        for currency, rate_sum, count in zip(
+            present_currencies, rate_sums.tolist(), rate_counts.tolist()
+        ):
+            currencies_found[currency] = count
+            if count > 0:
+                mean_rates[currency] = rate_sum / count
+        
+        total_records: int = int(rate_counts.sum())
         
         # Report missing currencies
         if missing_currencies:
             print(f"WARNING: Missing currencies in CSV columns: {', '.join(missing_currencies)}")
         
         # Validate we have data
-        if not historical_data:
+        if total_records == 0:
             raise ValueError(
                 f"No valid historical rates found for any target currencies. "
                 f"Currencies found: {currencies_found}"
             )
         
-        result_df: pd.DataFrame = pd.DataFrame(historical_data)
-        
         # Report summary of data extracted
-        for curr, count in currencies_found.items():
-            print(f"  - {curr}: {count} records")
+        summary_lines: List[str] = [
+            f"  - {curr}: {count} records" for curr, count in currencies_found.items()
+        ]
+        summary_lines.append(f"SUCCESS: Extracted {total_records} historical rate records")
+        print('\n'.join(summary_lines))
         
-        print(f"SUCCESS: Extracted {len(result_df)} historical rate records")
-        return result_df
+        print("INFO: Calculating mean historical rates...")
+        
+        # Validate all target currencies have means
+        missing_means: List[str] = [curr for curr in TARGET_CURRENCIES if curr not in mean_rates]
+        if missing_means:
+            print(f"WARNING: No historical data to calculate means for: {', '.join(missing_means)}")
+        
+        # Report calculated means
+        mean_lines: List[str] = [
+            f"  - {curr}: {mean_value:.4f}" for curr, mean_value in mean_rates.items()
+        ]
+        mean_lines.append(f"SUCCESS: Calculated means for {len(mean_rates)} currencies")
+        print('\n'.join(mean_lines))
+        return mean_rates
         
     except pd.errors.EmptyDataError:
         error_msg: str = f"CSV file is empty or malformed: {csv_file}"
@@ -217,47 +391,17 @@ def parse_historical_rates(csv_file: Path) -> pd.DataFrame:
         raise RuntimeError(error_msg) from e
 
 
-def calculate_mean_rates(df: pd.DataFrame) -> Dict[str, float]:
+def _format_rate(rate: float | None) -> str:
     """
-    Calculate the mean historical rate for each currency.
+    Format a rate for the HTML table.
     
     Args:
-        df: DataFrame containing historical rates with 'currency' and 'rate' columns
+        rate: Exchange rate, or None if it is not available
         
     Returns:
-        Dictionary mapping currency codes to their mean historical rates
-        
-    Raises:
-        ValueError: If DataFrame is empty or missing required columns
+        Rate rounded to 4 decimal places, or "N/A" for a missing rate
     """
-    print("INFO: Calculating mean historical rates...")
-    
-    # Validate input DataFrame
-    if df.empty:
-        raise ValueError("Cannot calculate means: DataFrame is empty")
-    
-    if 'currency' not in df.columns or 'rate' not in df.columns:
-        raise ValueError("DataFrame missing required columns: 'currency' and/or 'rate'")
-    
-    try:
-        mean_rates: Dict[str, float] = df.groupby('currency')['rate'].mean().to_dict()
-        
-        # Validate all target currencies have means
-        missing_means: List[str] = [curr for curr in TARGET_CURRENCIES if curr not in mean_rates]
-        if missing_means:
-            print(f"WARNING: No historical data to calculate means for: {', '.join(missing_means)}")
-        
-        # Report calculated means
-        for currency, mean_value in mean_rates.items():
-            print(f"  - {currency}: {mean_value:.4f}")
-        
-        print(f"SUCCESS: Calculated means for {len(mean_rates)} currencies")
-        return mean_rates
-    
-    except Exception as e:
-        error_msg: str = f"Error calculating mean rates: {type(e).__name__}: {e}"
-        print(f"ERROR: {error_msg}")
-        raise RuntimeError(error_msg) from e
+    return "N/A" if rate is None else f"{rate:.4f}"
 
 
 def create_html_table(daily_rates: Dict[str, float], mean_rates: Dict[str, float]) -> str:
@@ -273,79 +417,18 @@ def create_html_table(daily_rates: Dict[str, float], mean_rates: Dict[str, float
     """
     print("INFO: Creating HTML table...")
     
-    # Create DataFrame for easy table generation
-    table_data: List[Dict[str, str | float]] = []
-    
-    currency: str
-    for currency in TARGET_CURRENCIES:
-        daily_rate: float | None = daily_rates.get(currency)
-        mean_rate: float | None = mean_rates.get(currency)
-        
-        table_data.append({
-            'Currency Code': currency,
-            'Rate': f"{daily_rate:.4f}" if daily_rate else "N/A",
-            'Mean Historical Rate': f"{mean_rate:.4f}" if mean_rate else "N/A"
-        })
+    # Build the table rows directly; a DataFrame is not worth it for a fixed 4-row table
+    rows_html: str = '\n'.join(
+        f"""    <tr>
+      <td>{currency}</td>
+      <td>{_format_rate(daily_rates.get(currency))}</td>
+      <td>{_format_rate(mean_rates.get(currency))}</td>
+    </tr>"""
+        for currency in TARGET_CURRENCIES
+    )
     
-    df: pd.DataFrame = pd.DataFrame(table_data)
-    
-    # Generate HTML with styling
-    html: str = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Exchange Rates Report</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        h1 {{
-            color: #333;
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background-color: white;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }}
-        th {{
-            background-color: #4CAF50;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: bold;
-        }}
-        td {{
-            padding: 10px 12px;
-            border-bottom: 1px solid #ddd;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 20px;
-            color: #666;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <h1>Exchange Rates Report</h1>
-    {df.to_html(index=False, border=0, classes='rate-table')}
-    <div class="footer">
-        <p>Exchange rates relative to EUR | Source: European Central Bank</p>
-    </div>
-</body>
-</html>
-"""
+    # Only the table rows change between calls; the page shell is a module constant
+    html: str = _HTML_TEMPLATE.substitute(rows=rows_html)
     
     print("SUCCESS: HTML table created successfully")
     return html
@@ -373,15 +456,10 @@ def save_html_report(html_content: str, output_file: Path) -> None:
         # Ensure parent directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        f: Any
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # write_bytes opens, writes and closes in one call and returns the file
+        # size directly, so no stat is needed
+        file_size: int = output_file.write_bytes(html_content.encode('utf-8'))
         
-        # Verify file was created
-        if not output_file.exists():
-            raise IOError(f"File was not created: {output_file}")
-        
-        file_size: int = output_file.stat().st_size
         print(f"SUCCESS: Report saved successfully to {output_file.absolute()} ({file_size:,} bytes)")
         
     except PermissionError as e:
@@ -411,10 +489,9 @@ def main() -> int:
     
     try:
         # Define file paths
-        current_dir: Path = Path(__file__).parent
-        daily_csv: Path = current_dir / 'eurofxref.csv'
-        historical_csv: Path = current_dir / 'eurofxref-hist.csv'
-        output_html: Path = current_dir / 'exchange_rates.html'
+        daily_csv: Path = _HERE / 'eurofxref.csv'
+        historical_csv: Path = _HERE / 'eurofxref-hist.csv'
+        output_html: Path = _HERE / 'exchange_rates.html'
         
         # Verify input files exist upfront
         missing_files: List[str] = []
@@ -431,15 +508,14 @@ def main() -> int:
         # Step 1: Parse daily rates
         daily_rates: Dict[str, float] = parse_daily_rates(daily_csv)
         
-        # Step 2: Parse historical rates
-        historical_df: pd.DataFrame = parse_historical_rates(historical_csv)
-        
-        # Step 3: Calculate mean historical rates
-        mean_rates: Dict[str, float] = calculate_mean_rates(historical_df)
+        # Steps 2-3: Stream historical rates and calculate their means
+        mean_rates: Dict[str, float] = compute_historical_means(historical_csv)
         
         # Validate we have data for all target currencies (at least in one source)
-        all_currencies: set[str] = set(daily_rates.keys()) | set(mean_rates.keys())
-        missing_all: List[str] = [curr for curr in TARGET_CURRENCIES if curr not in all_currencies]
+        missing_all: List[str] = [
+            curr for curr in TARGET_CURRENCIES
+            if curr not in daily_rates and curr not in mean_rates
+        ]
         
         if missing_all:
             print(f"WARNING: No data found for currencies: {', '.join(missing_all)}")
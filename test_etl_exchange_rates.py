@@ -0,0 +1,45 @@
+"""
+Regression checks for etl_exchange_rates.py parsing of malformed rate cells.
+"""
+
+from pathlib import Path
+import etl_exchange_rates as etl
+
+
+def test_daily_rates_skip_non_numeric_cell(tmp_path: Path) -> None:
+    daily_csv: Path = tmp_path / 'daily.csv'
+    daily_csv.write_text(
+        "Date, USD, JPY, SEK, GBP, \n"
+        "06 February 2026, 1.1794, abc, 10.6735, N/A , \n"
+    )
+    
+    daily_rates = etl.parse_daily_rates(daily_csv)
+    
+    assert daily_rates == {'USD': 1.1794, 'SEK': 10.6735}
+
+
+def test_historical_means_skip_non_numeric_cells(tmp_path: Path) -> None:
+    historical_csv: Path = tmp_path / 'historical.csv'
+    historical_csv.write_text(
+        "Date,USD,JPY,SEK,GBP,\n"
+        "2026-02-06,1.0,100,abc,0.8,\n"
+        "2026-02-05,-,200,10.0,N/A ,\n"
+        "2026-02-04,3.0,,12.0,0.9,\n"
+        "2026-02-03,N/A,300,-1,1.0,\n"
+    )
+    
+    mean_rates = etl.compute_historical_means(historical_csv)
+    
+    assert mean_rates == {'USD': 2.0, 'SEK': 11.0, 'GBP': 0.9, 'JPY': 200.0}
+
+
+def test_daily_rates_reject_non_finite_values(tmp_path: Path) -> None:
+    daily_csv: Path = tmp_path / 'daily.csv'
+    daily_csv.write_text(
+        "Date, USD, JPY, SEK, GBP, \n"
+        "06 February 2026, nan, inf, 1e400, 0.8679, \n"
+    )
+    
+    daily_rates = etl.parse_daily_rates(daily_csv)
+    
+    assert daily_rates == {'GBP': 0.8679}